@@ -13,9 +13,6 @@
 # limitations under the License.
 
 import logging
-from urllib.parse import urlparse
-
-import huggingface_hub
 
 import pkg.initializers.types.types as types
 import pkg.initializers.utils.utils as utils
@@ -34,22 +31,23 @@ class HuggingFace(utils.DatasetProvider):
         self.config = types.HuggingFaceDatasetInitializer(**config_dict)
 
     def download_dataset(self):
-        storage_uri_parsed = urlparse(self.config.storage_uri)
-        dataset_uri = (
-            storage_uri_parsed.netloc + "/" + storage_uri_parsed.path.split("/")[1]
-        )
+        repo_id, revision = utils.parse_hf_uri(self.config.storage_uri)
+        dataset_uri = "/".join(repo_id.split("/")[:2])
 
         logging.info(f"Downloading dataset: {dataset_uri}")
         logging.info("-" * 40)
 
-        if self.config.access_token:
-            huggingface_hub.login(self.config.access_token)
+        utils.setup_hf_xet_high_performance(self.config.enable_xet_high_performance)
 
-        huggingface_hub.snapshot_download(
+        utils.hf_snapshot_download(
+            cache_dir=self.config.cache_dir,
             repo_id=dataset_uri,
             repo_type="dataset",
+            revision=revision,
+            token=self.config.access_token,
             local_dir=utils.DATASET_PATH,
             ignore_patterns=self.config.ignore_patterns,
+            max_workers=utils.get_hf_max_workers(self.config.max_workers),
         )
 
         logging.info("Dataset has been downloaded")
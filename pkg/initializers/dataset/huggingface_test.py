@@ -31,6 +31,9 @@ from pkg.initializers.dataset.huggingface import HuggingFace
                 "storage_uri": "hf://dataset/path",
                 "ignore_patterns": None,
                 "access_token": "test_token",
+                "max_workers": None,
+                "enable_xet_high_performance": None,
+                "cache_dir": None,
             },
         ),
         (
@@ -40,6 +43,9 @@ from pkg.initializers.dataset.huggingface import HuggingFace
                 "storage_uri": "hf://dataset/path",
                 "ignore_patterns": None,
                 "access_token": None,
+                "max_workers": None,
+                "enable_xet_high_performance": None,
+                "cache_dir": None,
             },
         ),
     ],
@@ -67,8 +73,12 @@ def test_load_config(test_name, test_config, expected):
                     "storage_uri": "hf://username/dataset-name",
                     "ignore_patterns": None,
                     "access_token": "test_token",
+                    "max_workers": None,
+                    "enable_xet_high_performance": None,
+                    "cache_dir": None,
                 },
-                "should_login": True,
+                "expected_max_workers": utils.HF_DEFAULT_MAX_WORKERS,
+                "expected_revision": None,
                 "expected_repo_id": "username/dataset-name",
             },
         ),
@@ -76,11 +86,15 @@ def test_load_config(test_name, test_config, expected):
             "Successful download without token",
             {
                 "config": {
-                    "storage_uri": "hf://org/dataset-v1",
+                    "storage_uri": "hf://org/dataset-v1@main",
                     "ignore_patterns": None,
                     "access_token": None,
+                    "max_workers": "16",
+                    "enable_xet_high_performance": "false",
+                    "cache_dir": None,
                 },
-                "should_login": False,
+                "expected_max_workers": 16,
+                "expected_revision": "main",
                 "expected_repo_id": "org/dataset-v1",
             },
         ),
@@ -94,24 +108,25 @@ def test_download_dataset(test_name, test_case):
     huggingface_dataset_instance = HuggingFace()
     huggingface_dataset_instance.config = MagicMock(**test_case["config"])
 
-    with patch("huggingface_hub.login") as mock_login, patch(
-        "huggingface_hub.snapshot_download"
-    ) as mock_download:
+    with patch("huggingface_hub.snapshot_download") as mock_download, patch.object(
+        utils, "setup_hf_xet_high_performance"
+    ) as mock_setup:
 
         # Execute download
         huggingface_dataset_instance.download_dataset()
 
-        # Verify login behavior
-        if test_case["should_login"]:
-            mock_login.assert_called_once_with(test_case["config"]["access_token"])
-        else:
-            mock_login.assert_not_called()
-
         # Verify download parameters
+        mock_setup.assert_called_once_with(
+            test_case["config"]["enable_xet_high_performance"]
+        )
         mock_download.assert_called_once_with(
             repo_id=test_case["expected_repo_id"],
+            revision=test_case["expected_revision"],
+            token=test_case["config"]["access_token"],
             local_dir=utils.DATASET_PATH,
             repo_type="dataset",
+            allow_patterns=None,
             ignore_patterns=test_case["config"]["ignore_patterns"],
+            max_workers=test_case["expected_max_workers"],
         )
     print("Test execution completed")
@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import fnmatch
 import logging
-from urllib.parse import urlparse
+from typing import Optional
 
 import huggingface_hub
 
@@ -26,6 +27,41 @@ logging.basicConfig(
     level=logging.INFO,
 )
 
+# The non-weight files which are required to load the model.
+MODEL_CONFIG_PATTERNS = ["*.json", "*.model", "*.txt", "tokenizer*"]
+
+
+# Get the allow and ignore patterns to download only one weight format from the repository.
+# HuggingFace repositories often ship the same weights as *.safetensors and *.bin, or as
+# FP32 and FP16/BF16 variants, so downloading all of them doubles the transferred bytes.
+def get_weight_patterns(
+    repo_files: list[str], weight_precision: Optional[str] = None
+) -> tuple[list[str], list[str]]:
+    weight_format = "bin"
+    if any(f.endswith(".safetensors") for f in repo_files):
+        weight_format = "safetensors"
+
+    if weight_precision:
+        allow_patterns = [f"*{weight_precision}*.{weight_format}"]
+    else:
+        allow_patterns = [f"*.{weight_format}"]
+
+    if not any(fnmatch.fnmatch(f, allow_patterns[0]) for f in repo_files):
+        raise ValueError(
+            f"No model weights in the repository match: {allow_patterns[0]}"
+        )
+
+    ignore_patterns = []
+    if weight_format == "safetensors":
+        ignore_patterns.append("*.bin")
+
+    # Skip FP32 variants only when the precision is not forced by the user.
+    weight_files = [f for f in repo_files if f.endswith(f".{weight_format}")]
+    if not weight_precision and any("fp16" in f or "bf16" in f for f in weight_files):
+        ignore_patterns.append("*fp32*")
+
+    return allow_patterns, ignore_patterns
+
 
 class HuggingFace(utils.ModelProvider):
 
@@ -34,24 +70,48 @@ class HuggingFace(utils.ModelProvider):
         self.config = types.HuggingFaceModelInitializer(**config_dict)
 
     def download_model(self):
-        storage_uri_parsed = urlparse(self.config.storage_uri)
-        model_uri = storage_uri_parsed.netloc + storage_uri_parsed.path
+        model_uri, revision = utils.parse_hf_uri(self.config.storage_uri)
 
         logging.info(f"Downloading model: {model_uri}")
         logging.info("-" * 40)
 
-        if self.config.access_token:
-            huggingface_hub.login(self.config.access_token)
+        utils.setup_hf_xet_high_performance(self.config.enable_xet_high_performance)
 
-        # TODO (andreyvelich): We should consider to follow vLLM approach with allow patterns.
-        # Ref: https://github.com/kubeflow/trainer/pull/2303#discussion_r1815913663
         # TODO (andreyvelich): We should update patterns for Mistral model
         # Ref: https://github.com/kubeflow/trainer/pull/2303#discussion_r1815914270
-        huggingface_hub.snapshot_download(
+        repo_files = huggingface_hub.list_repo_files(
+            model_uri, revision=revision, token=self.config.access_token
+        )
+        weight_patterns, weight_ignore_patterns = get_weight_patterns(
+            repo_files, self.config.weight_precision
+        )
+        logging.info(f"Downloading model weights: {weight_patterns}")
+
+        # The selected weight files take precedence over the configured ignore patterns.
+        weight_files = [
+            f for f in repo_files if any(fnmatch.fnmatch(f, p) for p in weight_patterns)
+        ]
+        ignore_patterns = []
+        for p in self.config.ignore_patterns or []:
+            if any(fnmatch.fnmatch(f, p) for f in weight_files):
+                logging.warning(
+                    f"Ignore pattern {p} is dropped since it matches the selected model weights"
+                )
+            else:
+                ignore_patterns.append(p)
+        ignore_patterns += [
+            p for p in weight_ignore_patterns if p not in ignore_patterns
+        ]
+
+        utils.hf_snapshot_download(
+            cache_dir=self.config.cache_dir,
             repo_id=model_uri,
+            revision=revision,
+            token=self.config.access_token,
             local_dir=utils.MODEL_PATH,
-            allow_patterns=["*.json", "*.safetensors", "*.model", "*.txt"],
-            ignore_patterns=self.config.ignore_patterns,
+            allow_patterns=MODEL_CONFIG_PATTERNS + weight_patterns,
+            ignore_patterns=ignore_patterns,
+            max_workers=utils.get_hf_max_workers(self.config.max_workers),
         )
 
         logging.info("Model has been downloaded")
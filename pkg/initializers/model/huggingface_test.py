@@ -17,7 +17,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 import pkg.initializers.utils.utils as utils
-from pkg.initializers.model.huggingface import HuggingFace
+from pkg.initializers.model.huggingface import HuggingFace, get_weight_patterns
 
 
 # Test cases for config loading
@@ -31,6 +31,10 @@ from pkg.initializers.model.huggingface import HuggingFace
                 "storage_uri": "hf://model/path",
                 "ignore_patterns": ["*.msgpack", "*.h5", "*.bin", "*.pt", "*.pth"],
                 "access_token": "test_token",
+                "max_workers": None,
+                "enable_xet_high_performance": None,
+                "cache_dir": None,
+                "weight_precision": None,
             },
         ),
         (
@@ -40,6 +44,10 @@ from pkg.initializers.model.huggingface import HuggingFace
                 "storage_uri": "hf://model/path",
                 "ignore_patterns": ["*.msgpack", "*.h5", "*.bin", "*.pt", "*.pth"],
                 "access_token": None,
+                "max_workers": None,
+                "enable_xet_high_performance": None,
+                "cache_dir": None,
+                "weight_precision": None,
             },
         ),
     ],
@@ -66,21 +74,85 @@ def test_load_config(test_name, test_config, expected):
                     "storage_uri": "hf://username/model-name",
                     "ignore_patterns": ["*.msgpack", "*.h5", "*.bin", "*.pt", "*.pth"],
                     "access_token": "test_token",
+                    "max_workers": None,
+                    "enable_xet_high_performance": None,
+                    "cache_dir": None,
+                    "weight_precision": None,
                 },
-                "should_login": True,
+                "repo_files": ["config.json", "model.safetensors", "pytorch_model.bin"],
+                "expected_max_workers": utils.HF_DEFAULT_MAX_WORKERS,
+                "expected_revision": None,
                 "expected_repo_id": "username/model-name",
+                "expected_allow_patterns": [
+                    "*.json",
+                    "*.model",
+                    "*.txt",
+                    "tokenizer*",
+                    "*.safetensors",
+                ],
+                "expected_ignore_patterns": [
+                    "*.msgpack",
+                    "*.h5",
+                    "*.bin",
+                    "*.pt",
+                    "*.pth",
+                ],
             },
         ),
         (
             "Successful download without token",
             {
                 "config": {
-                    "storage_uri": "hf://org/model-v1",
+                    "storage_uri": "hf://org/model-v1@main",
                     "ignore_patterns": ["*.msgpack", "*.h5", "*.bin", "*.pt", "*.pth"],
                     "access_token": None,
+                    "max_workers": "16",
+                    "enable_xet_high_performance": "false",
+                    "cache_dir": None,
+                    "weight_precision": None,
                 },
-                "should_login": False,
+                "repo_files": ["config.json", "pytorch_model.bin"],
+                "expected_max_workers": 16,
+                "expected_revision": "main",
                 "expected_repo_id": "org/model-v1",
+                "expected_allow_patterns": [
+                    "*.json",
+                    "*.model",
+                    "*.txt",
+                    "tokenizer*",
+                    "*.bin",
+                ],
+                "expected_ignore_patterns": ["*.msgpack", "*.h5", "*.pt", "*.pth"],
+            },
+        ),
+        (
+            "Successful download with forced weight precision",
+            {
+                "config": {
+                    "storage_uri": "hf://org/model-v2",
+                    "ignore_patterns": ["*.msgpack", "*.h5", "*.bin", "*.pt", "*.pth"],
+                    "access_token": None,
+                    "max_workers": None,
+                    "enable_xet_high_performance": None,
+                    "cache_dir": None,
+                    "weight_precision": "fp16",
+                },
+                "repo_files": [
+                    "config.json",
+                    "pytorch_model.fp16-00001-of-00002.bin",
+                    "pytorch_model.fp16-00002-of-00002.bin",
+                ],
+                "expected_max_workers": utils.HF_DEFAULT_MAX_WORKERS,
+                "expected_revision": None,
+                "expected_repo_id": "org/model-v2",
+                "expected_allow_patterns": [
+                    "*.json",
+                    "*.model",
+                    "*.txt",
+                    "tokenizer*",
+                    "*fp16*.bin",
+                ],
+                "expected_ignore_patterns": ["*.msgpack", "*.h5", "*.pt", "*.pth"],
             },
         ),
     ],
@@ -93,24 +165,106 @@ def test_download_model(test_name, test_case):
     huggingface_model_instance = HuggingFace()
     huggingface_model_instance.config = MagicMock(**test_case["config"])
 
-    with patch("huggingface_hub.login") as mock_login, patch(
-        "huggingface_hub.snapshot_download"
-    ) as mock_download:
+    with patch("huggingface_hub.snapshot_download") as mock_download, patch(
+        "huggingface_hub.list_repo_files", return_value=test_case["repo_files"]
+    ) as mock_list_files, patch.object(
+        utils, "setup_hf_xet_high_performance"
+    ) as mock_setup:
 
         # Execute download
         huggingface_model_instance.download_model()
 
-        # Verify login behavior
-        if test_case["should_login"]:
-            mock_login.assert_called_once_with(test_case["config"]["access_token"])
-        else:
-            mock_login.assert_not_called()
-
         # Verify download parameters
+        mock_setup.assert_called_once_with(
+            test_case["config"]["enable_xet_high_performance"]
+        )
+        mock_list_files.assert_called_once_with(
+            test_case["expected_repo_id"],
+            revision=test_case["expected_revision"],
+            token=test_case["config"]["access_token"],
+        )
         mock_download.assert_called_once_with(
             repo_id=test_case["expected_repo_id"],
+            revision=test_case["expected_revision"],
+            token=test_case["config"]["access_token"],
             local_dir=utils.MODEL_PATH,
-            allow_patterns=["*.json", "*.safetensors", "*.model", "*.txt"],
-            ignore_patterns=test_case["config"]["ignore_patterns"],
+            allow_patterns=test_case["expected_allow_patterns"],
+            ignore_patterns=test_case["expected_ignore_patterns"],
+            max_workers=test_case["expected_max_workers"],
         )
     print("Test execution completed")
+
+
+@pytest.mark.parametrize(
+    "test_name, repo_files, weight_precision, expected, expected_error",
+    [
+        (
+            "Prefer safetensors over bin",
+            ["model.safetensors", "pytorch_model.bin"],
+            None,
+            (["*.safetensors"], ["*.bin"]),
+            None,
+        ),
+        (
+            "Fall back to bin",
+            ["pytorch_model.bin"],
+            None,
+            (["*.bin"], []),
+            None,
+        ),
+        (
+            "Skip FP32 shards when FP16 shards are present",
+            [
+                "model.fp32-00001-of-00002.safetensors",
+                "model.fp16-00001-of-00002.safetensors",
+            ],
+            None,
+            (["*.safetensors"], ["*.bin", "*fp32*"]),
+            None,
+        ),
+        (
+            "Force weight precision",
+            ["model.safetensors", "model.fp16.safetensors"],
+            "fp16",
+            (["*fp16*.safetensors"], ["*.bin"]),
+            None,
+        ),
+        (
+            "Force FP32 weight precision when FP16 shards are present",
+            [
+                "model.fp32-00001-of-00002.safetensors",
+                "model.fp16-00001-of-00002.safetensors",
+            ],
+            "fp32",
+            (["*fp32*.safetensors"], ["*.bin"]),
+            None,
+        ),
+        (
+            "Forced weight precision matches no files",
+            ["model.fp16-00001-of-00002.safetensors"],
+            "bf16",
+            None,
+            ValueError,
+        ),
+        (
+            "Repository without model weights",
+            ["config.json", "model.gguf"],
+            None,
+            None,
+            ValueError,
+        ),
+    ],
+)
+def test_get_weight_patterns(
+    test_name, repo_files, weight_precision, expected, expected_error
+):
+    """Test weight format selection from the repository files"""
+    print(f"Running test: {test_name}")
+
+    if expected_error:
+        with pytest.raises(expected_error):
+            get_weight_patterns(repo_files, weight_precision)
+    else:
+        assert get_weight_patterns(repo_files, weight_precision) == expected
+
+    print("Test execution completed")
@@ -23,6 +23,9 @@ class HuggingFaceDatasetInitializer:
     storage_uri: str
     ignore_patterns: Optional[list[str]] = None
     access_token: Optional[str] = None
+    max_workers: Optional[str] = None
+    enable_xet_high_performance: Optional[str] = None
+    cache_dir: Optional[str] = None
 
 
 # Configuration for the S3 dataset initializer.
@@ -45,6 +48,10 @@ class HuggingFaceModelInitializer:
         default_factory=lambda: ["*.msgpack", "*.h5", "*.bin", "*.pt", "*.pth"]
     )
     access_token: Optional[str] = None
+    max_workers: Optional[str] = None
+    enable_xet_high_performance: Optional[str] = None
+    cache_dir: Optional[str] = None
+    weight_precision: Optional[str] = None
 
 
 # Configuration for the S3 model initializer.
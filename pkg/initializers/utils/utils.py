@@ -12,16 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 import os
+import re
+import shutil
 from abc import ABC, abstractmethod
 from dataclasses import fields
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import huggingface_hub
+from huggingface_hub.utils import filter_repo_objects
 
 STORAGE_URI_ENV = "STORAGE_URI"
 HF_SCHEME = "hf"
 CACHE_SCHEME = "cache"
 S3_SCHEME = "s3"
 
+# The HuggingFace storage URI format: hf://<repo_id>[@<revision>]
+HF_URI_REGEX = re.compile(r"^hf://([^@]+)(?:@(.+))?$")
+
 # The default path to the users' workspace.
 # TODO (andreyvelich): Discuss how to keep this path is sync with Kubeflow SDK constants.
 WORKSPACE_PATH = "/workspace"
@@ -32,6 +42,12 @@ DATASET_PATH = os.path.join(WORKSPACE_PATH, "dataset")
 # The path where initializer downloads model.
 MODEL_PATH = os.path.join(WORKSPACE_PATH, "model")
 
+# The config values which disable a boolean initializer option.
+FALSE_VALUES = ("false", "0", "no", "off")
+
+# The default number of files that HuggingFace initializers download in parallel.
+HF_DEFAULT_MAX_WORKERS = min(8, os.cpu_count() or 4)
+
 
 class ModelProvider(ABC):
     @abstractmethod
@@ -71,3 +87,77 @@ def get_config_from_env(config) -> Dict:
             config_from_env[field.name] = env_value if env_value else None
 
     return config_from_env
+
+
+# Get the repository ID and the optional revision from the HuggingFace storage URI.
+def parse_hf_uri(storage_uri: str) -> Tuple[str, Optional[str]]:
+    match = HF_URI_REGEX.match(storage_uri)
+    if not match:
+        raise ValueError(f"Invalid HuggingFace storage URI: {storage_uri}")
+    return match.group(1), match.group(2)
+
+
+# Get the number of parallel HuggingFace download workers from the config value.
+def get_hf_max_workers(max_workers: Optional[str]) -> int:
+    if not max_workers:
+        return HF_DEFAULT_MAX_WORKERS
+    try:
+        return max(1, int(max_workers))
+    except ValueError:
+        raise ValueError(f"MAX_WORKERS must be an integer: {max_workers}")
+
+
+# Enable the hf_xet high-performance mode for the HuggingFace downloads.
+# The hf_transfer backend is replaced by hf_xet in huggingface_hub 1.x, so
+# HF_XET_HIGH_PERFORMANCE is the switch that saturates the available bandwidth.
+# Users can opt out by setting ENABLE_XET_HIGH_PERFORMANCE to "false", "0", "no" or "off".
+def setup_hf_xet_high_performance(enable_xet_high_performance: Optional[str]):
+    if (
+        enable_xet_high_performance
+        and enable_xet_high_performance.strip().lower() in FALSE_VALUES
+    ):
+        return
+
+    try:
+        import hf_xet  # noqa: F401
+    except ImportError:
+        logging.warning("hf_xet is not installed, using the default HTTP download")
+        return
+
+    os.environ.setdefault("HF_XET_HIGH_PERFORMANCE", "1")
+
+
+# Download the HuggingFace repository snapshot to the local directory.
+# When cache_dir is set (e.g. a shared ReadWriteMany PVC), the files are stored once in the
+# HuggingFace cache keyed by the revision SHA and copied to the local directory from there,
+# so re-runs and other TrainJobs skip the files which are already downloaded.
+# The shared snapshot may contain files downloaded by other jobs, so only the files matching
+# this download's allow and ignore patterns are copied.
+def hf_snapshot_download(
+    local_dir: str,
+    cache_dir: Optional[str] = None,
+    allow_patterns: Optional[list[str]] = None,
+    ignore_patterns: Optional[list[str]] = None,
+    **kwargs,
+):
+    kwargs.update(allow_patterns=allow_patterns, ignore_patterns=ignore_patterns)
+
+    if not cache_dir:
+        huggingface_hub.snapshot_download(local_dir=local_dir, **kwargs)
+        return
+
+    logging.info(f"Using HuggingFace cache: {cache_dir}")
+    snapshot_path = Path(
+        huggingface_hub.snapshot_download(cache_dir=cache_dir, **kwargs)
+    )
+    snapshot_files = [
+        f.relative_to(snapshot_path).as_posix()
+        for f in snapshot_path.rglob("*")
+        if f.is_file()
+    ]
+    for file in filter_repo_objects(
+        snapshot_files, allow_patterns=allow_patterns, ignore_patterns=ignore_patterns
+    ):
+        destination = Path(local_dir) / file
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(snapshot_path / file, destination)
@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import sys
+from unittest.mock import patch
+
 import pytest
 
 import pkg.initializers.types.types as types
@@ -32,6 +36,10 @@ import pkg.initializers.utils.utils as utils
                 "storage_uri": "hf://test",
                 "ignore_patterns": ["*.msgpack", "*.h5"],
                 "access_token": "token",
+                "max_workers": None,
+                "enable_xet_high_performance": None,
+                "cache_dir": None,
+                "weight_precision": None,
             },
         ),
         (
@@ -41,6 +49,10 @@ import pkg.initializers.utils.utils as utils
                 "storage_uri": "hf://test",
                 "ignore_patterns": None,
                 "access_token": None,
+                "max_workers": None,
+                "enable_xet_high_performance": None,
+                "cache_dir": None,
+                "weight_precision": None,
             },
         ),
         (
@@ -49,17 +61,29 @@ import pkg.initializers.utils.utils as utils
                 "STORAGE_URI": "hf://test",
                 "IGNORE_PATTERNS": "*.log,*.txt",
                 "ACCESS_TOKEN": "token",
+                "MAX_WORKERS": "4",
+                "ENABLE_XET_HIGH_PERFORMANCE": "false",
             },
             {
                 "storage_uri": "hf://test",
                 "ignore_patterns": ["*.log", "*.txt"],
                 "access_token": "token",
+                "max_workers": "4",
+                "enable_xet_high_performance": "false",
+                "cache_dir": None,
             },
         ),
         (
             types.HuggingFaceDatasetInitializer,
             {"STORAGE_URI": "hf://test"},
-            {"storage_uri": "hf://test", "ignore_patterns": None, "access_token": None},
+            {
+                "storage_uri": "hf://test",
+                "ignore_patterns": None,
+                "access_token": None,
+                "max_workers": None,
+                "enable_xet_high_performance": None,
+                "cache_dir": None,
+            },
         ),
         (
             types.S3DatasetInitializer,
@@ -151,3 +175,122 @@ def test_get_config_from_env(mock_env_vars, config_class, env_vars, expected):
     mock_env_vars(**env_vars)
     result = utils.get_config_from_env(config_class)
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "storage_uri,expected",
+    [
+        ("hf://org/model", ("org/model", None)),
+        ("hf://org/model@main", ("org/model", "main")),
+        ("hf://org/dataset/subset@abc123", ("org/dataset/subset", "abc123")),
+    ],
+)
+def test_parse_hf_uri(storage_uri, expected):
+    assert utils.parse_hf_uri(storage_uri) == expected
+
+
+def test_parse_hf_uri_invalid():
+    with pytest.raises(ValueError):
+        utils.parse_hf_uri("s3://bucket/model")
+
+
+@pytest.mark.parametrize(
+    "max_workers,expected,expected_error",
+    [
+        (None, utils.HF_DEFAULT_MAX_WORKERS, None),
+        ("", utils.HF_DEFAULT_MAX_WORKERS, None),
+        ("16", 16, None),
+        ("0", 1, None),
+        ("eight", None, ValueError),
+    ],
+)
+def test_get_hf_max_workers(max_workers, expected, expected_error):
+    if expected_error:
+        with pytest.raises(expected_error, match="MAX_WORKERS must be an integer"):
+            utils.get_hf_max_workers(max_workers)
+    else:
+        assert utils.get_hf_max_workers(max_workers) == expected
+
+
+@pytest.mark.parametrize(
+    "enable_xet_high_performance,expected",
+    [
+        (None, "1"),
+        ("true", "1"),
+        ("1", "1"),
+        ("false", None),
+        ("False", None),
+        ("0", None),
+        ("no", None),
+        ("OFF", None),
+    ],
+)
+def test_setup_hf_xet_high_performance(
+    mock_env_vars, enable_xet_high_performance, expected
+):
+    pytest.importorskip("hf_xet")
+    mock_env_vars(HF_XET_HIGH_PERFORMANCE=None)
+    utils.setup_hf_xet_high_performance(enable_xet_high_performance)
+    assert os.environ.get("HF_XET_HIGH_PERFORMANCE") == expected
+
+
+def test_setup_hf_xet_high_performance_without_hf_xet(mock_env_vars):
+    mock_env_vars(HF_XET_HIGH_PERFORMANCE=None)
+    with patch.dict(sys.modules, {"hf_xet": None}):
+        utils.setup_hf_xet_high_performance(None)
+    assert "HF_XET_HIGH_PERFORMANCE" not in os.environ
+
+
+def test_hf_snapshot_download(tmp_path):
+    local_dir = tmp_path / "model"
+
+    with patch("huggingface_hub.snapshot_download") as mock_download:
+        utils.hf_snapshot_download(
+            local_dir=str(local_dir),
+            repo_id="org/model",
+            allow_patterns=["*.json", "*.txt", "*.safetensors"],
+            ignore_patterns=["*fp32*"],
+        )
+
+    mock_download.assert_called_once_with(
+        local_dir=str(local_dir),
+        repo_id="org/model",
+        allow_patterns=["*.json", "*.txt", "*.safetensors"],
+        ignore_patterns=["*fp32*"],
+    )
+    # The files are written to local_dir by snapshot_download, not copied by the helper.
+    assert not local_dir.exists()
+
+
+def test_hf_snapshot_download_with_cache(tmp_path):
+    local_dir = tmp_path / "model"
+    cache_dir = tmp_path / "cache"
+    snapshot_path = tmp_path / "snapshot"
+    (snapshot_path / "tokenizer").mkdir(parents=True)
+    (snapshot_path / "config.json").write_text("{}")
+    (snapshot_path / "tokenizer" / "vocab.txt").write_text("vocab")
+    (snapshot_path / "model.safetensors").write_text("weights")
+    # Files downloaded to the shared cache by other jobs.
+    (snapshot_path / "pytorch_model.bin").write_text("weights")
+    (snapshot_path / "model.fp32.safetensors").write_text("weights")
+
+    with patch(
+        "huggingface_hub.snapshot_download", return_value=str(snapshot_path)
+    ) as mock_download:
+        utils.hf_snapshot_download(
+            local_dir=str(local_dir),
+            cache_dir=str(cache_dir),
+            repo_id="org/model",
+            allow_patterns=["*.json", "*.txt", "*.safetensors"],
+            ignore_patterns=["*fp32*"],
+        )
+
+    mock_download.assert_called_once_with(
+        cache_dir=str(cache_dir),
+        repo_id="org/model",
+        allow_patterns=["*.json", "*.txt", "*.safetensors"],
+        ignore_patterns=["*fp32*"],
+    )
+    assert sorted(
+        f.relative_to(local_dir).as_posix() for f in local_dir.rglob("*") if f.is_file()
+    ) == ["config.json", "model.safetensors", "tokenizer/vocab.txt"]
@@ -53,7 +53,7 @@ class TestDatasetIntegration:
                 },
             ),
             (
-                "HuggingFace - Login Failure",
+                "HuggingFace - Invalid access token",
                 "huggingface",
                 {
                     "storage_uri": "hf://karpathy/tiny_shakespeare",
@@ -58,7 +58,7 @@ class TestModelIntegration:
                 },
             ),
             (
-                "HuggingFace - Login failure",
+                "HuggingFace - Invalid access token",
                 "huggingface",
                 {
                     "storage_uri": "hf://hf-internal-testing/tiny-random-bert",